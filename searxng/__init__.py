@@ -16,7 +16,14 @@ def main():
     )
     args = parser.parse_args()
 
-    asyncio.run(serve(instance_url=args.instance_url))
+    # Prefer uvloop where available; it is not supported on Windows, where
+    # the default asyncio event loop is used instead.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(serve(instance_url=args.instance_url))
+    else:
+        uvloop.run(serve(instance_url=args.instance_url))
 
 
 if __name__ == "__main__":
@@ -1,12 +1,26 @@
+import httpx
 import requests
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Sequence
 import logging
 
 
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    """
+    A single formatted search result
+    """
+
+    index: int
+    title: str
+    url: str
+    result: str
+
+
 class SearXNGClient:
     """
     SearXNG Search client
-    Used to perform searches and format the results into the specified JSON format
+    Used to perform searches and format the results into indexed SearchHit items
     """
 
     def __init__(self, instance_url: str = "https://searx.party"):
@@ -18,12 +32,14 @@ class SearXNGClient:
         """
         self.instance_url = instance_url
         self.logger = logging.getLogger(__name__)
+        # Created lazily by asearch() so it binds to the running event loop
+        self._async_client: Optional[httpx.AsyncClient] = None
 
     def search(
         self,
         query: str,
-        categories: Optional[List[str]] = None,
-        engines: Optional[List[str]] = None,
+        categories: Optional[Sequence[str]] = None,
+        engines: Optional[Sequence[str]] = None,
         language: str = "en",
         max_results: int = 20,
         timeout: int = 30,
@@ -64,10 +80,155 @@ class SearXNGClient:
         - enabled_engines: list of engines to enable
         - disabled_engines: list of engines to disable
         Returns:
-        - Structured search result JSON
+        - Dictionary with the original "query" and "content", a list of SearchHit
+          items (not directly JSON serializable)
+        """
+        self.logger.info(f"Start search: {query}")
+
+        params = self._build_params(
+            query,
+            categories=categories,
+            engines=engines,
+            language=language,
+            pageno=pageno,
+            time_range=time_range,
+            safesearch=safesearch,
+            format=format,
+            results_on_new_tab=results_on_new_tab,
+            image_proxy=image_proxy,
+            autocomplete=autocomplete,
+            theme=theme,
+            enabled_plugins=enabled_plugins,
+            disabled_plugins=disabled_plugins,
+            enabled_engines=enabled_engines,
+            disabled_engines=disabled_engines,
+        )
+
+        # Build request URL
+        url = f"{self.instance_url}/search"
+
+        try:
+            # Send search request
+            self.logger.info(f"Request URL: {url} Parameters: {params}")
+            response = requests.get(url, params=params, timeout=timeout)
+            response.raise_for_status()  # Check for HTTP errors
+
+            # Parse response
+            search_results = self._check_response(response.json())
+            self.logger.info(f"Got {len(search_results.get('results', []))} results")
+
+            # Format results
+            return self._format_results(query, search_results, max_results)
+
+        except (requests.RequestException, ValueError) as e:
+            self.logger.error(f"Request error: {e}")
+            # Return empty results on error
+            return self._format_results(query, {"results": []}, 0)
+
+    async def asearch(
+        self,
+        query: str,
+        categories: Optional[Sequence[str]] = None,
+        engines: Optional[Sequence[str]] = None,
+        language: str = "en",
+        max_results: int = 20,
+        timeout: int = 30,
+        pageno: int = 1,
+        time_range: Optional[str] = None,
+        safesearch: int = 0,
+        format: str = "json",
+        results_on_new_tab: Optional[int] = None,
+        image_proxy: Optional[bool] = None,
+        autocomplete: Optional[str] = None,
+        theme: Optional[str] = None,
+        enabled_plugins: Optional[List[str]] = None,
+        disabled_plugins: Optional[List[str]] = None,
+        enabled_engines: Optional[List[str]] = None,
+        disabled_engines: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Asynchronous variant of `search()` using a shared httpx.AsyncClient
+
+        Takes the same parameters and returns the same structure as `search()`.
         """
         self.logger.info(f"Start search: {query}")
 
+        params = self._build_params(
+            query,
+            categories=categories,
+            engines=engines,
+            language=language,
+            pageno=pageno,
+            time_range=time_range,
+            safesearch=safesearch,
+            format=format,
+            results_on_new_tab=results_on_new_tab,
+            image_proxy=image_proxy,
+            autocomplete=autocomplete,
+            theme=theme,
+            enabled_plugins=enabled_plugins,
+            disabled_plugins=disabled_plugins,
+            enabled_engines=enabled_engines,
+            disabled_engines=disabled_engines,
+        )
+
+        # Build request URL
+        url = f"{self.instance_url}/search"
+
+        if self._async_client is None:
+            # Follow redirects like requests does in search()
+            self._async_client = httpx.AsyncClient(follow_redirects=True)
+
+        try:
+            # Send search request
+            self.logger.info(f"Request URL: {url} Parameters: {params}")
+            response = await self._async_client.get(url, params=params, timeout=timeout)
+            response.raise_for_status()  # Check for HTTP errors
+
+            # Parse response
+            search_results = self._check_response(response.json())
+            self.logger.info(f"Got {len(search_results.get('results', []))} results")
+
+            # Format results
+            return self._format_results(query, search_results, max_results)
+
+        # ValueError covers non-JSON responses (httpx raises JSONDecodeError,
+        # unlike requests) and JSON payloads that are not an object
+        except (httpx.HTTPError, ValueError) as e:
+            self.logger.error(f"Request error: {e}")
+            # Return empty results on error
+            return self._format_results(query, {"results": []}, 0)
+
+    async def aclose(self) -> None:
+        """
+        Close the HTTP client used by `asearch()`, if one was created
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def _build_params(
+        self,
+        query: str,
+        categories: Optional[Sequence[str]],
+        engines: Optional[Sequence[str]],
+        language: str,
+        pageno: int,
+        time_range: Optional[str],
+        safesearch: int,
+        format: str,
+        results_on_new_tab: Optional[int],
+        image_proxy: Optional[bool],
+        autocomplete: Optional[str],
+        theme: Optional[str],
+        enabled_plugins: Optional[List[str]],
+        disabled_plugins: Optional[List[str]],
+        enabled_engines: Optional[List[str]],
+        disabled_engines: Optional[List[str]],
+    ) -> Dict[str, Any]:
+        """
+        Build SearXNG query parameters, omitting unset optional values
+        """
         # Build query parameters
         params = {
             "q": query,
@@ -101,32 +262,29 @@ class SearXNGClient:
         if disabled_engines:
             params["disabled_engines"] = ",".join(disabled_engines)
 
-        # Build request URL
-        url = f"{self.instance_url}/search"
-
-        try:
-            # Send search request
-            self.logger.info(f"Request URL: {url} Parameters: {params}")
-            response = requests.get(url, params=params, timeout=timeout)
-            response.raise_for_status()  # Check for HTTP errors
-
-            # Parse response
-            search_results = response.json()
-            self.logger.info(f"Got {len(search_results.get('results', []))} results")
+        return params
 
-            # Format results
-            return self._format_results(query, search_results, max_results)
+    def _check_response(self, search_data: Any) -> Dict[str, Any]:
+        """
+        Check that a decoded SearXNG response has the expected shape
 
-        except requests.RequestException as e:
-            self.logger.error(f"Request error: {e}")
-            # Return empty results on error
-            return self._format_results(query, {"results": []}, 0)
+        Raises:
+            ValueError: if the payload is not an object with a list of result objects
+        """
+        if not isinstance(search_data, dict):
+            raise ValueError("SearXNG response is not a JSON object")
+        results = search_data.get("results", [])
+        if not isinstance(results, list) or not all(
+            isinstance(result, dict) for result in results
+        ):
+            raise ValueError("SearXNG response has malformed results")
+        return search_data
 
     def _format_results(
         self, query: str, search_data: Dict[str, Any], max_results: int
     ) -> Dict[str, Any]:
         """
-        Format search results into the specified JSON format, including title and url.
+        Format search results into indexed SearchHit items, including title and url.
 
         Parameters:
             query: original query
@@ -134,26 +292,19 @@ class SearXNGClient:
             max_results: maximum result count
 
         Returns:
-            Formatted JSON result with each item containing index, title, url, and result (content).
+            Formatted result whose content is a list of SearchHit items (index, title, url, and result).
         """
-        # Initialize result list
-        formatted_results: list[dict] = []
-
-        # Process normal search results
+        # Build indexed results list from normal search results
         results = search_data.get("results", [])
-        for index, result in enumerate(results[:max_results]):
-            title = result.get("title", "")
-            url = result.get("url", "")
-            content = result.get("content", "")
-
-            # Add to indexed results list
-            content_item = {
-                "index": index,
-                "title": title,
-                "url": url,
-                "result": content,
-            }
-            formatted_results.append(content_item)
+        formatted_results: list[SearchHit] = [
+            SearchHit(
+                index=index,
+                title=result.get("title", ""),
+                url=result.get("url", ""),
+                result=result.get("content", ""),
+            )
+            for index, result in enumerate(results[:max_results])
+        ]
 
         # Build final result
         final_result = {
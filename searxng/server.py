@@ -1,15 +1,18 @@
-import json
-from typing import Any, Optional, Sequence
+from __future__ import annotations
 
+import asyncio
+import sys
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Sequence
+
+import orjson
+from cachetools import TTLCache
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.shared.exceptions import McpError
 from mcp.types import (
-    BlobResourceContents,
-    EmbeddedResource,
+    INTERNAL_ERROR,
     ErrorData,
     Icon,
-    ImageContent,
     TextContent,
     TextResourceContents,
     Tool,
@@ -19,13 +22,169 @@ from pydantic import AnyUrl
 
 from searxng.client import SearXNGClient
 
-# Default SearXNG search parameters
-DEFAULT_CATEGORIES = ["general"]
-DEFAULT_ENGINES = ["google", "bing", "duckduckgo"]
+if TYPE_CHECKING:
+    # Only used in handler annotations
+    from mcp.types import BlobResourceContents, EmbeddedResource, ImageContent
+
+# Default SearXNG search parameters (tuples, so they are shared rather than copied)
+DEFAULT_CATEGORIES = ("general",)
+DEFAULT_ENGINES = ("google", "bing", "duckduckgo")
 DEFAULT_LANGUAGE = "en"
 DEFAULT_MAX_RESULTS = 10
 DEFAULT_SAFESEARCH = 1
 
+# Search result cache settings
+CACHE_MAXSIZE = 1024
+CACHE_TTL = 300  # seconds
+
+# web_search_batch limits, to keep one call from flooding the SearXNG instance
+MAX_BATCH_QUERIES = 20
+MAX_BATCH_CONCURRENCY = 5
+
+# Text template for a single search result, filled from a SearchHit
+_RESULT_FMT = "[{0.index}] {0.title}\nURL: {0.url}\n{0.result}\n".format
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string (UTF-8, non-ASCII kept as-is)."""
+    return orjson.dumps(obj).decode()
+
+
+def _copy_results(search_results: dict[str, Any]) -> dict[str, Any]:
+    """Copy cached search results; SearchHit items are frozen and can be shared."""
+    return {**search_results, "content": list(search_results["content"])}
+
+
+def _cache_key_part(values: Sequence[str]) -> tuple[str, ...]:
+    """Normalize a category/engine list into a sorted tuple of interned strings."""
+    return tuple(sorted(map(sys.intern, values)))
+
+
+_DEFAULT_CATEGORIES_KEY = _cache_key_part(DEFAULT_CATEGORIES)
+_DEFAULT_ENGINES_KEY = _cache_key_part(DEFAULT_ENGINES)
+
+
+# Values used for optional search arguments that are omitted, shared by the
+# web_search and web_search_batch tools
+_SEARCH_OPTION_DEFAULTS: dict[str, Any] = {
+    "categories": None,
+    "engines": None,
+    "language": DEFAULT_LANGUAGE,
+    "max_results": DEFAULT_MAX_RESULTS,
+    "time_range": None,
+}
+
+# web_search tool arguments and the values used when they are omitted
+_WEB_SEARCH_ARGUMENTS: dict[str, Any] = {"query": None, **_SEARCH_OPTION_DEFAULTS}
+
+# web_search_batch tool arguments and the values used when they are omitted
+_WEB_SEARCH_BATCH_ARGUMENTS: dict[str, Any] = {
+    "queries": None,
+    **_SEARCH_OPTION_DEFAULTS,
+}
+
+# Resource and tool definitions are static, so build them once at import
+_RESOURCES_LIST = [
+    {
+        "uri": "searxng://web/search",
+        "name": "Web Search",
+        "description": "Use SearXNG to search the web for information",
+        "mimeType": "application/json",
+    }
+]
+
+# Optional search parameters shared by the web_search and web_search_batch tools
+_SEARCH_OPTION_PROPERTIES: dict[str, Any] = {
+    "categories": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Search categories, e.g. ['general', 'images', 'news']",
+    },
+    "engines": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Search engines, e.g. ['google', 'bing', 'duckduckgo']",
+    },
+    "language": {
+        "type": "string",
+        "description": "Search language code (default 'en')",
+    },
+    "max_results": {
+        "type": "integer",
+        "description": "Maximum number of results to return (default 10)",
+    },
+    "time_range": {
+        "type": "string",
+        "description": "Time range filter ('day', 'week', 'month', 'year')",
+    },
+}
+
+# Icon and annotations shared by the search tools
+_SEARCH_ICON = Icon(
+    src="search-icon.png",
+    mimeType="image/png",
+    sizes=["32x32"],
+    model_config={},
+)
+
+_SEARCH_ANNOTATIONS = ToolAnnotations(
+    title="SearXNG Tool",
+    readOnlyHint=True,
+    destructiveHint=False,
+    idempotentHint=True,
+    openWorldHint=False,
+    model_config={"version": "1.0"},
+)
+
+_WEB_SEARCH_TOOL = Tool(
+    name="web_search",
+    description="Use SearXNG to search the web for information",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query string",
+            },
+            **_SEARCH_OPTION_PROPERTIES,
+        },
+        "required": ["query"],
+    },
+    title="Web Search Tool",
+    outputSchema=None,
+    icons=[_SEARCH_ICON],
+    annotations=_SEARCH_ANNOTATIONS,
+    meta={
+        "category": "search",
+        "tags": ["web", "search", "tool"],
+    },
+    model_config={
+        "timeout": 30,
+        "retry": 3,
+    },
+)
+
+_WEB_SEARCH_BATCH_TOOL = _WEB_SEARCH_TOOL.model_copy(
+    update={
+        "name": "web_search_batch",
+        "description": "Use SearXNG to run several web searches concurrently",
+        "title": "Web Search Batch Tool",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "queries": {
+                    "type": "array",
+                    "items": {"type": "string", "minLength": 1},
+                    "maxItems": MAX_BATCH_QUERIES,
+                    "description": f"Search query strings (at most {MAX_BATCH_QUERIES})",
+                },
+                **_SEARCH_OPTION_PROPERTIES,
+            },
+            "required": ["queries"],
+        },
+    }
+)
+
 
 class SearXNGServer:
     """
@@ -43,12 +202,14 @@ class SearXNGServer:
         - instance_url: SearXNG instance URL
         """
         self.searxng_client = SearXNGClient(instance_url=instance_url)
+        self._cache: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+        self._inflight: dict[tuple, asyncio.Task] = {}
 
     async def search(
         self,
         query: str,
-        categories: Optional[list[str]] = None,
-        engines: Optional[list[str]] = None,
+        categories: Optional[Sequence[str]] = None,
+        engines: Optional[Sequence[str]] = None,
         language: str = DEFAULT_LANGUAGE,
         max_results: int = DEFAULT_MAX_RESULTS,
         time_range: Optional[str] = None,
@@ -67,32 +228,75 @@ class SearXNGServer:
         Returns:
             dict: Structured search results dictionary with keys:
                 - query: The original query string.
-                - content: List of results, each containing:
+                - content: List of `SearchHit` results, each with:
                     - index: Result index.
                     - title: Result title.
                     - url: Result URL.
                     - result: Result content/summary.
         """
-        # Set default search parameters
+        # Set default search parameters, reusing the prebuilt cache key parts
         if categories is None:
-            categories = DEFAULT_CATEGORIES.copy()
+            categories = DEFAULT_CATEGORIES
+            categories_key = _DEFAULT_CATEGORIES_KEY
+        else:
+            categories_key = _cache_key_part(categories)
         if engines is None:
-            engines = DEFAULT_ENGINES.copy()
+            engines = DEFAULT_ENGINES
+            engines_key = _DEFAULT_ENGINES_KEY
+        else:
+            engines_key = _cache_key_part(engines)
+
+        key = (
+            query,
+            categories_key,
+            engines_key,
+            language,
+            max_results,
+            time_range,
+        )
 
+        cached = self._cache.get(key)
+        if cached is not None:
+            return _copy_results(cached)
+
+        # Coalesce concurrent identical searches into a single upstream request
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._search_uncached(
+                    key,
+                    query=query,
+                    categories=categories,
+                    engines=engines,
+                    language=language,
+                    max_results=max_results,
+                    time_range=time_range,
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        search_results = await asyncio.shield(task)
+        return _copy_results(search_results)
+
+    async def _search_uncached(self, key: tuple, **kwargs: Any) -> dict[str, Any]:
+        """
+        Query the SearXNG instance and cache non-empty results under `key`.
+        """
         # Use SearXNG client to perform search
-        search_results = self.searxng_client.search(
-            query=query,
-            categories=categories,
-            engines=engines,
-            language=language,
-            max_results=max_results,
-            time_range=time_range,
+        search_results = await self.searxng_client.asearch(
             safesearch=DEFAULT_SAFESEARCH,
+            **kwargs,
         )
 
+        # The client reports request failures as an empty result set, so
+        # only cache responses that actually carry results.
+        if search_results.get("content"):
+            self._cache[key] = search_results
+
         return search_results
 
-    def format_search_results(self, search_results: dict[str, Any]) -> list[str]:
+    def format_search_results(self, search_results: dict[str, Any]) -> tuple[str, ...]:
         """
         Format search results into text output.
 
@@ -100,21 +304,37 @@ class SearXNGServer:
             search_results: Search results dictionary as returned by `search()`.
 
         Returns:
-            str: Formatted search results text, each line includes index, title, url, and result content.
+            tuple[str, ...]: Formatted search results, each entry includes index, title, url, and result content.
+        """
+        content_items = search_results.get("content")
+        if not content_items:
+            # The empty tuple is a shared singleton, so nothing is allocated
+            return ()
+        return tuple(map(_RESULT_FMT, content_items))
+
+    def format_as_text_content(
+        self, search_results: dict[str, Any]
+    ) -> Iterator[TextContent]:
         """
-        # Build formatted output
-        output = []
-        # Add content results
-        content_items = search_results.get("content", [])
-        if content_items:
-            for item in content_items:
-                index = item.get("index", "")
-                title = item.get("title", "")
-                url = item.get("url", "")
-                result = item.get("result", "")
-                output.append(f"[{index}] {title}\nURL: {url}\n{result}\n")
+        Format search results directly into MCP text content blocks.
+
+        Blocks are produced lazily, so the MCP server's own list of results
+        is the only one built.
+
+        Args:
+            search_results: Search results dictionary as returned by `search()`.
 
-        return output
+        Returns:
+            Iterator[TextContent]: One text block per result, formatted as in
+                `format_search_results()`.
+        """
+        return (
+            TextContent(
+                type="text",
+                text=_RESULT_FMT(item),
+            )
+            for item in search_results.get("content", ())
+        )
 
 
 async def serve(instance_url: str = "https://searx.party"):
@@ -126,18 +346,13 @@ async def serve(instance_url: str = "https://searx.party"):
     """
     server = Server("SearXNGServer")
     searxng_server = SearXNGServer(instance_url=instance_url)
+    # Shared by all web_search_batch calls to bound upstream concurrency
+    batch_semaphore = asyncio.Semaphore(MAX_BATCH_CONCURRENCY)
 
     @server.list_resources()
     async def handle_list_resources():
         """List available search resources"""
-        return [
-            {
-                "uri": "searxng://web/search",
-                "name": "Web Search",
-                "description": "Use SearXNG to search the web for information",
-                "mimeType": "application/json",
-            }
-        ]
+        return _RESOURCES_LIST
 
     @server.read_resource()
     async def handle_read_resource(
@@ -150,10 +365,7 @@ async def serve(instance_url: str = "https://searx.party"):
                 TextResourceContents(
                     uri=AnyUrl(uri),
                     mimeType="application/json",
-                    text=json.dumps(
-                        {"message": "This feature is not yet implemented"},
-                        ensure_ascii=False,
-                    ),
+                    text=_dumps({"message": "This feature is not yet implemented"}),
                 )
             ]
         raise ValueError(f"Unsupported URI: {uri}")
@@ -161,105 +373,64 @@ async def serve(instance_url: str = "https://searx.party"):
     @server.list_tools()
     async def list_tools() -> list[Tool]:
         """List available search tools"""
-        return [
-            Tool(
-                name="web_search",
-                description="Use SearXNG to search the web for information",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query string",
-                        },
-                        "categories": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Search categories, e.g. ['general', 'images', 'news']",
-                        },
-                        "engines": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Search engines, e.g. ['google', 'bing', 'duckduckgo']",
-                        },
-                        "language": {
-                            "type": "string",
-                            "description": "Search language code (default 'en')",
-                        },
-                        "max_results": {
-                            "type": "integer",
-                            "description": "Maximum number of results to return (default 10)",
-                        },
-                        "time_range": {
-                            "type": "string",
-                            "description": "Time range filter ('day', 'week', 'month', 'year')",
-                        },
-                    },
-                    "required": ["query"],
-                },
-                title="Web Search Tool",
-                outputSchema=None,
-                icons=[
-                    Icon(
-                        src="search-icon.png",
-                        mimeType="image/png",
-                        sizes=["32x32"],
-                        model_config={},
-                    ),
-                ],
-                annotations=ToolAnnotations(
-                    title="SearXNG Tool",
-                    readOnlyHint=True,
-                    destructiveHint=False,
-                    idempotentHint=True,
-                    openWorldHint=False,
-                    model_config={"version": "1.0"},
-                ),
-                meta={
-                    "category": "search",
-                    "tags": ["web", "search", "tool"],
-                },
-                model_config={
-                    "timeout": 30,
-                    "retry": 3,
-                },
-            )
-        ]
+        return [_WEB_SEARCH_TOOL, _WEB_SEARCH_BATCH_TOOL]
 
     @server.call_tool()
     async def call_tool(
         name: str, arguments: dict[str, Any]
-    ) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    ) -> Iterable[TextContent | ImageContent | EmbeddedResource]:
         """Processing tool call request"""
         try:
             if name == "web_search":
-                query = arguments.get("query")
+                params = {**_WEB_SEARCH_ARGUMENTS, **arguments}
+                query = params["query"]
                 if not query:
                     raise ValueError("Missing required parameter: query")
 
-                categories = arguments.get("categories")
-                engines = arguments.get("engines")
-                language = arguments.get("language", DEFAULT_LANGUAGE)
-                max_results = arguments.get("max_results", DEFAULT_MAX_RESULTS)
-                time_range = arguments.get("time_range")
-
                 search_results = await searxng_server.search(
                     query=query,
-                    categories=categories,
-                    engines=engines,
-                    language=language,
-                    max_results=max_results,
-                    time_range=time_range,
+                    categories=params["categories"],
+                    engines=params["engines"],
+                    language=params["language"],
+                    max_results=params["max_results"],
+                    time_range=params["time_range"],
+                )
+
+                return searxng_server.format_as_text_content(search_results)
+
+            if name == "web_search_batch":
+                params = {**_WEB_SEARCH_BATCH_ARGUMENTS, **arguments}
+                queries = params["queries"]
+                if not queries or not all(queries):
+                    raise ValueError("Missing required parameter: queries")
+                if len(queries) > MAX_BATCH_QUERIES:
+                    raise ValueError(
+                        f"Too many queries: at most {MAX_BATCH_QUERIES} are allowed"
+                    )
+
+                async def limited_search(query: str) -> dict[str, Any]:
+                    async with batch_semaphore:
+                        return await searxng_server.search(
+                            query=query,
+                            categories=params["categories"],
+                            engines=params["engines"],
+                            language=params["language"],
+                            max_results=params["max_results"],
+                            time_range=params["time_range"],
+                        )
+
+                # Run the searches concurrently, bounded by batch_semaphore
+                batch_results = await asyncio.gather(
+                    *(limited_search(query) for query in queries)
                 )
 
-                formatted_results = searxng_server.format_search_results(search_results)
+                # Prefix each query's results with a header so they can be told apart
+                def batch_contents() -> Iterator[TextContent]:
+                    for query, search_results in zip(queries, batch_results):
+                        yield TextContent(type="text", text=f"Query: {query}\n")
+                        yield from searxng_server.format_as_text_content(search_results)
 
-                return [
-                    TextContent(
-                        type="text",
-                        text=result,
-                    ) for result in formatted_results
-                ]
+                return batch_contents()
 
             return [
                 TextContent(
@@ -268,16 +439,22 @@ async def serve(instance_url: str = "https://searx.party"):
                 )
             ]
 
-        except Exception as e:
+        # SearXNGClient.asearch() turns HTTP and response errors into empty
+        # results, so only invalid tool arguments reach here as ValueError;
+        # anything else is left to the MCP server.
+        except ValueError as e:
             error = ErrorData(
                 message=f"Search service error: {e}",
-                code=-32603,
+                code=INTERNAL_ERROR,
             )
             raise McpError(error)
 
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        await searxng_server.searxng_client.aclose()